@@ -10,7 +10,7 @@ This script tests the Wyoming Piper TTS container by:
 5. Optionally playing the audio
 
 Usage:
-    python3 test_voice.py [--host HOST] [--port PORT] [--play] [--text TEXT]
+    python3 test_voice.py [--host HOST] [--port PORT] [--play] [--text TEXT | --smoke]
 
 Requirements:
     pip install wyoming
@@ -20,17 +20,78 @@ Author: Claude Code
 
 import asyncio
 import argparse
+import hashlib
 import io
+import json
+import math
 import os
+import re
+import shutil
+import socket
 import subprocess
 import sys
+import time
 import wave
 from pathlib import Path
-from typing import List, Dict, Optional
+from typing import List, Dict, Optional, Tuple
+
+# Coalesce small per-chunk PCM writes into 128 KiB syscalls
+WAV_WRITE_BUFFER_SIZE = 128 * 1024
+
+# Large audio chunks: let the StreamReader buffer more before pausing reads
+STREAM_READER_LIMIT = 1 << 20
+
+# Cache directory for server info between runs
+CACHE_DIR = Path.home() / ".cache" / "wyoming-piper-gpu"
+
+# Seconds a cached server info / voice list stays valid
+SERVER_INFO_CACHE_TTL = 300
+
+# Synthesized audio cache, keyed by voice, text and voice quality settings
+AUDIO_CACHE_DIR = CACHE_DIR / "audio"
+AUDIO_CACHE_MAX_ENTRIES = 32
+
+# .env settings that change the synthesized audio for a given voice and text
+_AUDIO_CACHE_ENV_KEYS = (
+    'PIPER_LENGTH',
+    'PIPER_NOISE',
+    'PIPER_NOISEW',
+    'PIPER_SPEAKER',
+    'PIPER_SILENCE',
+)
+
+# KEY=value lines in .env; comments and blank lines never match
+_ENV_LINE_RE = re.compile(
+    r'^[ \t]*([A-Za-z_][A-Za-z0-9_]*)[ \t]*=[ \t]*(.*?)[ \t\r]*$',
+    re.MULTILINE
+)
+
+# Settings that process environment variables may override, e.g. in CI
+_ENV_OVERRIDE_KEYS = ('PIPER_VOICE',) + _AUDIO_CACHE_ENV_KEYS
+
+# Parsed .env contents keyed by (path, mtime_ns, size) to skip re-parsing
+_ENV_CACHE: Optional[Tuple[Tuple[Path, int, int], Dict[str, str]]] = None
+
+# Common audio players to try, in order of preference
+AUDIO_PLAYERS = [
+    ['paplay'],  # PulseAudio
+    ['aplay'],   # ALSA
+    ['ffplay', '-nodisp', '-autoexit'],  # FFmpeg
+    ['cvlc', '--play-and-exit', '--intf', 'dummy'],  # VLC
+    ['mpg123'],  # mpg123
+    ['play'],    # SoX
+]
+
+# Short phrase for --smoke; GPU synthesis time scales with text length
+SMOKE_TEST_TEXT = "Piper TTS smoke test."
+
+# Minimum seconds between progress dots while receiving audio
+PROGRESS_INTERVAL = 0.1
 
 try:
     from wyoming.audio import AudioChunk, AudioStop
     from wyoming.client import AsyncTcpClient
+    from wyoming.event import Event
     from wyoming.tts import Synthesize, SynthesizeVoice
     from wyoming.info import Describe, Info
 except ImportError:
@@ -38,6 +99,16 @@ except ImportError:
     print("Install with: pip install wyoming")
     sys.exit(1)
 
+try:
+    import numpy as np
+except ImportError:
+    np = None  # Only needed for --analyze
+
+
+# Event type strings, resolved once for plain comparisons in the receive loop
+AUDIO_CHUNK_TYPE = AudioChunk(rate=0, width=0, channels=0, audio=b'').event().type
+AUDIO_STOP_TYPE = AudioStop().event().type
+
 
 def print_banner():
     """Print test banner"""
@@ -46,32 +117,161 @@ def print_banner():
     print("=" * 60)
 
 
-async def get_server_info(host: str, port: int) -> Optional[Dict]:
-    """Get server information and available voices."""
+class _TunedTcpClient(AsyncTcpClient):
+    """TCP Wyoming client with a StreamReader limit sized for audio chunks."""
+    
+    async def connect(self) -> None:
+        connect = asyncio.open_connection(
+            host=self.host,
+            port=self.port,
+            limit=STREAM_READER_LIMIT
+        )
+        
+        # connect_timeout only exists in newer wyoming releases
+        connect_timeout = getattr(self, 'connect_timeout', None)
+        if connect_timeout is not None:
+            connect = asyncio.wait_for(connect, timeout=connect_timeout)
+        
+        self._reader, self._writer = await connect
+
+
+def _tune_client_socket(client: AsyncTcpClient) -> None:
+    """Disable Nagle and write buffering so small Wyoming events go out immediately."""
+    writer = client._writer
+    if writer is None:
+        return
+    
+    sock = writer.get_extra_info('socket')
+    if sock is not None:
+        sock.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
+    
+    writer.transport.set_write_buffer_limits(0)
+
+
+async def connect_client(host: str, port: int) -> Optional[AsyncTcpClient]:
+    """Open a single Wyoming connection shared by all requests in this run."""
+    client = _TunedTcpClient(host, port)
     try:
-        async with AsyncTcpClient(host, port) as client:
-            print(f"✓ Connected to {host}:{port}")
-            
-            # Request server info
-            await client.write_event(Describe().event())
-            
-            while True:
-                event = await client.read_event()
-                if event is None:
-                    break
-                    
-                if Info.is_type(event.type):
-                    info = Info.from_event(event)
-                    return {
-                        'name': info.name,
-                        'version': info.version,
-                        'description': info.description,
-                        'voices': _extract_voices(info)
-                    }
-                    
+        await client.connect()
     except Exception as e:
         print(f"✗ Failed to connect to {host}:{port}: {e}")
         return None
+    
+    _tune_client_socket(client)
+    print(f"✓ Connected to {host}:{port}")
+    return client
+
+
+async def get_server_info(
+    client: AsyncTcpClient,
+    pipelined_event: Optional[Event] = None
+) -> Optional[Dict]:
+    """Get server information and available voices.
+    
+    If pipelined_event is given it is sent right after Describe, without
+    waiting for Info. The server answers events in order, so its response
+    stays buffered on the connection for the next reader.
+    """
+    try:
+        # Request server info
+        await client.write_event(Describe().event())
+        
+        if pipelined_event is not None:
+            await client.write_event(pipelined_event)
+        
+        while True:
+            event = await client.read_event()
+            if event is None:
+                break
+                
+            if Info.is_type(event.type):
+                info = Info.from_event(event)
+                return {
+                    'name': info.name,
+                    'version': info.version,
+                    'description': info.description,
+                    'voices': _extract_voices(info)
+                }
+                
+    except Exception as e:
+        print(f"✗ Failed to get server info: {e}")
+    
+    return None
+
+
+def _server_info_cache_path(host: str, port: int) -> Path:
+    """Return the cache file holding server info for host:port."""
+    return CACHE_DIR / f"{host}_{port}.json"
+
+
+def load_cached_server_info(host: str, port: int) -> Optional[Dict]:
+    """Load cached server info if it is younger than SERVER_INFO_CACHE_TTL."""
+    cache_path = _server_info_cache_path(host, port)
+    try:
+        if time.time() - cache_path.stat().st_mtime > SERVER_INFO_CACHE_TTL:
+            return None
+        return json.loads(cache_path.read_text())
+    except (OSError, ValueError):
+        return None
+
+
+def save_server_info_cache(host: str, port: int, server_info: Dict) -> None:
+    """Persist server info so later runs can skip the Describe round-trip."""
+    cache_path = _server_info_cache_path(host, port)
+    try:
+        cache_path.parent.mkdir(parents=True, exist_ok=True)
+        cache_path.write_text(json.dumps(server_info))
+    except OSError as e:
+        print(f"⚠️  Could not write server info cache: {e}")
+
+
+def audio_cache_path(
+    host: str,
+    port: int,
+    server_info: Dict,
+    voice_name: Optional[str],
+    text: str,
+    env_config: Dict[str, str]
+) -> Path:
+    """Return the content-addressed cache file for a synthesis request.
+    
+    The server address, name and version are part of the key so audio
+    produced by one server is never reported as a result for another.
+    """
+    parts = [
+        f"{host}:{port}",
+        str(server_info['name']),
+        str(server_info['version']),
+        voice_name or '',
+        text,
+    ] + [env_config.get(key, '') for key in _AUDIO_CACHE_ENV_KEYS]
+    key = hashlib.blake2b('\0'.join(parts).encode(), digest_size=16).hexdigest()
+    return AUDIO_CACHE_DIR / f"{key}.wav"
+
+
+def load_cached_audio(cache_file: Path, output_file: str) -> bool:
+    """Copy cached audio to output_file, returning False on a cache miss."""
+    try:
+        shutil.copyfile(cache_file, output_file)
+        os.utime(cache_file)  # Mark as recently used for eviction
+    except OSError:
+        return False
+    return True
+
+
+def save_audio_cache(output_file: str, cache_file: Path) -> None:
+    """Atomically store synthesized audio and evict the oldest entries."""
+    try:
+        cache_file.parent.mkdir(parents=True, exist_ok=True)
+        tmp_file = cache_file.with_suffix('.tmp')
+        shutil.copyfile(output_file, tmp_file)
+        os.replace(tmp_file, cache_file)
+        
+        entries = sorted(cache_file.parent.glob('*.wav'), key=lambda p: p.stat().st_mtime)
+        for entry in entries[:-AUDIO_CACHE_MAX_ENTRIES]:
+            entry.unlink(missing_ok=True)
+    except OSError as e:
+        print(f"⚠️  Could not write audio cache: {e}")
 
 
 def _extract_voices(info: Info) -> List[Dict]:
@@ -90,114 +290,235 @@ def _extract_voices(info: Info) -> List[Dict]:
     return voices
 
 
+def _synthesize_event(text: str, voice_name: Optional[str] = None) -> Event:
+    """Build a synthesis request, configuring the voice if specified."""
+    voice = SynthesizeVoice(name=voice_name) if voice_name else None
+    return Synthesize(text=text, voice=voice).event()
+
+
 async def synthesize_test_text(
-    host: str, 
-    port: int, 
+    client: AsyncTcpClient, 
     text: str, 
     output_file: str,
-    voice_name: Optional[str] = None
+    voice_name: Optional[str] = None,
+    request_sent: bool = False,
+    show_progress: bool = True,
+    analyze: bool = False
 ) -> bool:
-    """Synthesize text and save to WAV file."""
+    """Synthesize text and save to WAV file.
+    
+    Set request_sent when the Synthesize event was already pipelined
+    behind Describe, so only the audio response is read here. Disable
+    show_progress when several syntheses share the terminal. With
+    analyze, RMS and peak levels of 16-bit audio are measured with NumPy
+    as chunks arrive.
+    """
+    # Audio streams to a temp file, moved into place only after AudioStop so
+    # a failed synthesis never leaves a truncated WAV at output_file
+    part_file = Path(f"{output_file}.part")
+    
     try:
-        async with AsyncTcpClient(host, port) as client:
-            print(f"🎵 Synthesizing: \"{text}\"")
-            
-            # Configure voice if specified
-            voice = None
-            if voice_name:
-                voice = SynthesizeVoice(name=voice_name)
-                print(f"🎤 Using voice: {voice_name}")
-            
-            # Send synthesis request
-            synthesize = Synthesize(text=text, voice=voice)
-            await client.write_event(synthesize.event())
-            
-            # Collect audio response
-            audio_data = bytearray()
-            audio_params = None
-            chunk_count = 0
-            
-            print("📥 Receiving audio data...", end=" ")
-            
+        print(f"🎵 Synthesizing: \"{text}\"")
+        
+        if voice_name:
+            print(f"🎤 Using voice: {voice_name}")
+        
+        # Send synthesis request
+        if not request_sent:
+            await client.write_event(_synthesize_event(text, voice_name))
+        
+        # Stream audio response to the temp file
+        completed = False
+        part_fp = None
+        wav_file = None
+        rate = width = channels = 0
+        chunk_count = 0
+        total_bytes = 0
+        sum_squares = 0
+        peak = 0
+        last_progress = time.monotonic()
+        
+        # Progress dots share a line, so later messages start a new one
+        line_start = "\n" if show_progress else ""
+        if show_progress:
+            print("📥 Receiving audio data...", end=" ", flush=True)
+        
+        try:
             while True:
                 event = await client.read_event()
                 if event is None:
-                    print("\n✗ Connection lost during synthesis")
+                    print(f"{line_start}✗ Connection lost during synthesis")
                     return False
                 
-                if AudioStop.is_type(event.type):
-                    print(f"\n✓ Received {chunk_count} audio chunks")
+                if event.type == AUDIO_STOP_TYPE:
+                    print(f"{line_start}✓ Received {chunk_count} audio chunks")
+                    completed = True
                     break
                 
-                if AudioChunk.is_type(event.type):
+                if event.type == AUDIO_CHUNK_TYPE:
                     chunk = AudioChunk.from_event(event)
                     chunk_count += 1
                     
-                    # Store audio parameters from first chunk
-                    if audio_params is None:
-                        audio_params = {
-                            'rate': chunk.rate,
-                            'width': chunk.width,
-                            'channels': chunk.channels
-                        }
-                        print(f"\n📊 Audio format: {chunk.rate}Hz, {chunk.width*8}-bit, {chunk.channels} channel(s)")
+                    # Open WAV file once audio parameters are known from first chunk
+                    if wav_file is None:
+                        rate, width, channels = chunk.rate, chunk.width, chunk.channels
+                        part_fp = open(part_file, 'wb', buffering=WAV_WRITE_BUFFER_SIZE)
+                        wav_file = wave.open(part_fp, 'wb')
+                        wav_file.setframerate(rate)
+                        wav_file.setsampwidth(width)
+                        wav_file.setnchannels(channels)
                     
-                    audio_data.extend(chunk.audio)
-                    print(".", end="", flush=True)
-            
-            # Save to WAV file
-            if audio_params and audio_data:
-                with wave.open(output_file, 'wb') as wav_file:
-                    wav_file.setframerate(audio_params['rate'])
-                    wav_file.setsampwidth(audio_params['width'])
-                    wav_file.setnchannels(audio_params['channels'])
-                    wav_file.writeframes(bytes(audio_data))
-                
-                duration = len(audio_data) / (audio_params['rate'] * audio_params['width'] * audio_params['channels'])
-                file_size = len(audio_data)
-                print(f"💾 Audio saved to: {output_file}")
-                print(f"📏 Duration: {duration:.1f}s, Size: {file_size:,} bytes")
-                return True
+                    wav_file.writeframes(chunk.audio)
+                    total_bytes += len(chunk.audio)
+                    
+                    if analyze and width == 2:
+                        samples = np.frombuffer(chunk.audio, dtype='<i2').astype(np.int64)
+                        if samples.size:
+                            sum_squares += int(np.dot(samples, samples))
+                            peak = max(peak, int(np.abs(samples).max()))
+                    
+                    now = time.monotonic()
+                    if show_progress and now - last_progress >= PROGRESS_INTERVAL:
+                        print(".", end="", flush=True)
+                        last_progress = now
+        finally:
+            # wave does not close file objects it did not open itself, so close
+            # the file even if finalizing the WAV header fails
+            try:
+                if wav_file is not None:
+                    wav_file.close()
+            finally:
+                if part_fp is not None:
+                    part_fp.close()
+        
+        # Report once after the stream ends to keep formatting out of the receive loop
+        if completed and total_bytes:
+            os.replace(part_file, output_file)
+            frames = total_bytes // (width * channels)
+            duration = frames / rate
+            print(f"📊 Audio format: {rate}Hz, {width * 8}-bit, {channels} channel(s)")
+            print(f"💾 Audio saved to: {output_file}")
+            print(f"📏 Duration: {duration:.1f}s, Size: {total_bytes:,} bytes")
             
+            if analyze:
+                _print_audio_levels(sum_squares, total_bytes // width, peak, width)
+            return True
+        
     except Exception as e:
         print(f"✗ Synthesis failed: {e}")
         return False
+    finally:
+        # No-op after a successful os.replace; otherwise drop the partial audio
+        part_file.unlink(missing_ok=True)
     
     return False
 
 
-def play_audio(file_path: str) -> bool:
+def _print_audio_levels(sum_squares: int, num_samples: int, peak: int, width: int) -> None:
+    """Print RMS and peak levels in dBFS from accumulated 16-bit sample stats."""
+    if width != 2:
+        print(f"⚠️  Level analysis only supports 16-bit audio, got {width * 8}-bit")
+        return
+    
+    full_scale = 32768
+    rms = math.sqrt(sum_squares / num_samples) if num_samples else 0.0
+    if rms == 0:
+        print("🔎 Levels: silent")
+        return
+    
+    rms_db = 20 * math.log10(rms / full_scale)
+    peak_db = 20 * math.log10(peak / full_scale)
+    clipped = " ⚠️  clipping" if peak >= full_scale - 1 else ""
+    print(f"🔎 Levels: RMS {rms_db:.1f} dBFS, peak {peak_db:.1f} dBFS{clipped}")
+
+
+def parse_voice_list(value: str) -> List[str]:
+    """Parse --voices into unique voice names that are safe to use in file names."""
+    names = [name.strip() for name in value.split(',') if name.strip()]
+    if not names:
+        raise argparse.ArgumentTypeError("expected at least one voice name")
+    
+    for name in names:
+        if '/' in name or '\\' in name:
+            raise argparse.ArgumentTypeError(f"invalid voice name: {name!r}")
+    
+    # Duplicates would write the same output file concurrently
+    return list(dict.fromkeys(names))
+
+
+def voice_output_file(output_file: str, voice_name: str) -> str:
+    """Derive a per-voice output path, e.g. test_output_en_US-amy-medium.wav."""
+    stem, suffix = os.path.splitext(output_file)
+    return f"{stem}_{voice_name}{suffix}"
+
+
+async def synthesize_voices(
+    host: str,
+    port: int,
+    text: str,
+    output_file: str,
+    voice_names: List[str],
+    concurrency: int,
+    analyze: bool = False
+) -> bool:
+    """Synthesize text with several voices in parallel, one connection each."""
+    semaphore = asyncio.Semaphore(concurrency)
+    
+    async def synthesize_voice(voice_name: str) -> bool:
+        async with semaphore:
+            client = await connect_client(host, port)
+            if client is None:
+                return False
+            try:
+                return await synthesize_test_text(
+                    client,
+                    text,
+                    voice_output_file(output_file, voice_name),
+                    voice_name,
+                    show_progress=False,
+                    analyze=analyze
+                )
+            finally:
+                await client.disconnect()
+    
+    print(f"🚀 Synthesizing {len(voice_names)} voices (concurrency {concurrency})...")
+    start = time.monotonic()
+    results = await asyncio.gather(*(synthesize_voice(name) for name in voice_names))
+    elapsed = time.monotonic() - start
+    
+    print(f"\n⏱️  {sum(results)}/{len(voice_names)} voices synthesized in {elapsed:.1f}s")
+    for voice_name, ok in zip(voice_names, results):
+        print(f"   {'✓' if ok else '✗'} {voice_name}")
+    
+    return all(results)
+
+
+async def play_audio(file_path: str) -> bool:
     """Attempt to play audio file using available system players."""
     if not os.path.exists(file_path):
         print(f"✗ Audio file not found: {file_path}")
         return False
     
-    # List of common audio players to try
-    players = [
-        ['paplay'],  # PulseAudio
-        ['aplay'],   # ALSA
-        ['ffplay', '-nodisp', '-autoexit'],  # FFmpeg
-        ['cvlc', '--play-and-exit', '--intf', 'dummy'],  # VLC
-        ['mpg123'],  # mpg123
-        ['play'],    # SoX
-    ]
-    
     print("🔊 Attempting to play audio...")
     
-    for player_cmd in players:
+    # Look players up on PATH instead of spawning each one to find out
+    available_players = [cmd for cmd in AUDIO_PLAYERS if shutil.which(cmd[0])]
+    
+    for player_cmd in available_players:
         try:
-            cmd = player_cmd + [file_path]
-            result = subprocess.run(
-                cmd, 
-                capture_output=True, 
-                timeout=10,
-                check=True
+            proc = await asyncio.create_subprocess_exec(
+                *player_cmd,
+                file_path,
+                stdout=subprocess.DEVNULL,
+                stderr=subprocess.DEVNULL
             )
-            if result.returncode == 0:
-                print(f"✓ Played audio using: {player_cmd[0]}")
-                return True
-        except (subprocess.CalledProcessError, subprocess.TimeoutExpired, FileNotFoundError):
+        except OSError:
             continue
+        
+        # No timeout: playback lasts as long as the audio
+        if await proc.wait() == 0:
+            print(f"✓ Played audio using: {player_cmd[0]}")
+            return True
     
     print("✗ No compatible audio player found")
     print("   Install one of: paplay, aplay, ffplay, vlc, mpg123, sox")
@@ -206,21 +527,151 @@ def play_audio(file_path: str) -> bool:
 
 
 def load_env_config() -> Dict[str, str]:
-    """Load configuration from .env file."""
+    """Load configuration from .env file, overridden by environment variables."""
+    global _ENV_CACHE
     env_file = Path(".env")
     config = {}
     
-    if env_file.exists():
-        with open(env_file, 'r') as f:
-            for line in f:
-                line = line.strip()
-                if line and not line.startswith('#') and '=' in line:
-                    key, value = line.split('=', 1)
-                    config[key.strip()] = value.strip()
+    try:
+        st = env_file.stat()
+    except OSError:
+        st = None
+    
+    if st is not None:
+        stamp = (env_file.resolve(), st.st_mtime_ns, st.st_size)
+        if _ENV_CACHE is None or _ENV_CACHE[0] != stamp:
+            _ENV_CACHE = (stamp, dict(_ENV_LINE_RE.findall(env_file.read_text())))
+        config.update(_ENV_CACHE[1])
+    
+    for key in _ENV_OVERRIDE_KEYS:
+        if key in os.environ:
+            config[key] = os.environ[key]
     
     return config
 
 
+async def _run_client_tests(
+    client: Optional[AsyncTcpClient],
+    args: argparse.Namespace,
+    target_voice: Optional[str],
+    env_config: Dict[str, str]
+) -> bool:
+    """Query server info and synthesize test audio over one connection."""
+    server_info = None
+    server_info_cached = False
+    synthesize_sent = False
+    use_cache = not args.no_cache
+    
+    # Parallel voice runs and level analysis always synthesize so they measure the stream
+    use_audio_cache = use_cache and not args.voices and not args.analyze
+    
+    if client is not None:
+        if use_cache and not args.refresh:
+            server_info = load_cached_server_info(args.host, args.port)
+            if server_info:
+                server_info_cached = True
+                print("📦 Using cached server info")
+        
+        if not server_info:
+            # Start synthesis without waiting for the Describe round-trip, unless
+            # the audio cache (keyed by server info) may make synthesis unnecessary
+            synthesize_event = None
+            if not args.voices and (not use_audio_cache or args.refresh):
+                synthesize_event = _synthesize_event(args.text, target_voice)
+            
+            server_info = await get_server_info(client, synthesize_event)
+            synthesize_sent = synthesize_event is not None
+            if server_info and use_cache:
+                save_server_info_cache(args.host, args.port, server_info)
+    
+    if not server_info:
+        print("❌ Cannot connect to Wyoming Piper server")
+        print(f"   Make sure container is running: docker-compose ps")
+        print(f"   Check logs: docker-compose logs wyoming-piper")
+        sys.exit(1)
+    
+    print(f"📋 Server: {server_info['name']} v{server_info['version']}")
+    if server_info['description']:
+        print(f"   {server_info['description']}")
+    
+    # Show available voices
+    voices = server_info['voices']
+    if voices:
+        print(f"\n🎤 Available voices ({len(voices)}):")
+        for voice in voices[:5]:  # Show first 5
+            langs = ', '.join(voice['languages']) if voice['languages'] else 'unknown'
+            desc = f" - {voice['description']}" if voice['description'] else ""
+            print(f"   • {voice['name']} ({langs}){desc}")
+        
+        if len(voices) > 5:
+            print(f"   ... and {len(voices) - 5} more")
+    else:
+        print("\n⚠️  No voices reported by server")
+    
+    print()
+    
+    if args.voices:
+        return await synthesize_voices(
+            args.host,
+            args.port,
+            args.text,
+            args.output,
+            args.voices,
+            args.concurrency,
+            args.analyze
+        )
+    
+    audio_cache_file = None
+    if use_audio_cache:
+        audio_cache_file = audio_cache_path(
+            args.host,
+            args.port,
+            server_info,
+            target_voice,
+            args.text,
+            env_config
+        )
+        
+        # Cached audio skips synthesis, so make sure the live server still answers
+        if server_info_cached and not args.refresh and audio_cache_file.exists():
+            print("🔍 Confirming live server before using cached audio...")
+            live_info = await get_server_info(client)
+            if not live_info:
+                print("❌ Wyoming Piper server did not answer Describe")
+                return False
+            
+            print(f"✓ Live server: {live_info['name']} v{live_info['version']}")
+            save_server_info_cache(args.host, args.port, live_info)
+            audio_cache_file = audio_cache_path(
+                args.host,
+                args.port,
+                live_info,
+                target_voice,
+                args.text,
+                env_config
+            )
+        
+        if not args.refresh and load_cached_audio(audio_cache_file, args.output):
+            print(f"📦 Using cached audio for: \"{args.text}\"")
+            print(f"💾 Audio saved to: {args.output}")
+            return True
+    
+    # Synthesize test audio
+    success = await synthesize_test_text(
+        client, 
+        args.text, 
+        args.output,
+        target_voice,
+        request_sent=synthesize_sent,
+        analyze=args.analyze
+    )
+    
+    if success and audio_cache_file is not None:
+        save_audio_cache(args.output, audio_cache_file)
+    
+    return success
+
+
 async def main():
     """Main test function."""
     parser = argparse.ArgumentParser(
@@ -231,7 +682,10 @@ Examples:
   python3 test_voice.py                    # Basic test
   python3 test_voice.py --play             # Test and play audio
   python3 test_voice.py --text "Hello!"    # Custom text
+  python3 test_voice.py --smoke            # Short phrase for health checks
   python3 test_voice.py --host 192.168.1.100 --port 10201  # Custom server
+  python3 test_voice.py --refresh          # Re-query server info and re-synthesize
+  python3 test_voice.py --voices en_US-amy-medium,en_US-ryan-medium  # Parallel voices
         """
     )
     
@@ -246,13 +700,19 @@ Examples:
         default=10200, 
         help='Wyoming Piper server port (default: 10200)'
     )
-    parser.add_argument(
+    text_group = parser.add_mutually_exclusive_group()
+    text_group.add_argument(
         '--text', 
         default="Hello! This is a test of the Wyoming Piper text to speech system. "
                 "I am demonstrating the current voice model configuration. "
                 "Can you hear the difference in voice characteristics?",
         help='Text to synthesize'
     )
+    text_group.add_argument(
+        '--smoke',
+        action='store_true',
+        help=f'Synthesize a short phrase ("{SMOKE_TEST_TEXT}") for quick health checks'
+    )
     parser.add_argument(
         '--output', 
         default='test_output.wav',
@@ -263,13 +723,49 @@ Examples:
         action='store_true',
         help='Automatically play the generated audio'
     )
-    parser.add_argument(
+    voice_group = parser.add_mutually_exclusive_group()
+    voice_group.add_argument(
         '--voice',
         help='Override voice model (uses .env PIPER_VOICE by default)'
     )
+    voice_group.add_argument(
+        '--voices',
+        type=parse_voice_list,
+        help='Comma-separated voices to synthesize in parallel, saved as OUTPUT_<voice>.wav'
+    )
+    parser.add_argument(
+        '--concurrency',
+        type=int,
+        default=4,
+        help='Maximum parallel syntheses with --voices (default: 4)'
+    )
+    parser.add_argument(
+        '--analyze',
+        action='store_true',
+        help='Report RMS and peak levels of the synthesized audio (requires numpy)'
+    )
+    parser.add_argument(
+        '--no-cache',
+        action='store_true',
+        help='Do not read or write the server info and audio caches'
+    )
+    parser.add_argument(
+        '--refresh',
+        action='store_true',
+        help='Ignore cached server info and audio and fetch them again'
+    )
     
     args = parser.parse_args()
     
+    if args.concurrency < 1:
+        parser.error("--concurrency must be at least 1")
+    
+    if args.smoke:
+        args.text = SMOKE_TEST_TEXT
+    
+    if args.analyze and np is None:
+        parser.error("--analyze requires numpy (pip install numpy)")
+    
     print_banner()
     
     # Load configuration
@@ -277,7 +773,7 @@ Examples:
     configured_voice = env_config.get('PIPER_VOICE')
     
     if configured_voice:
-        print(f"🔧 Configuration from .env:")
+        print(f"🔧 Configuration from .env / environment:")
         print(f"   PIPER_VOICE = {configured_voice}")
     
     # Use specified voice or env voice
@@ -287,54 +783,31 @@ Examples:
     
     print()
     
-    # Test server connection and get info
-    print("🔍 Checking server information...")
-    server_info = await get_server_info(args.host, args.port)
-    
-    if not server_info:
-        print("❌ Cannot connect to Wyoming Piper server")
-        print(f"   Make sure container is running: docker-compose ps")
-        print(f"   Check logs: docker-compose logs wyoming-piper")
-        sys.exit(1)
-    
-    print(f"📋 Server: {server_info['name']} v{server_info['version']}")
-    if server_info['description']:
-        print(f"   {server_info['description']}")
-    
-    # Show available voices
-    voices = server_info['voices']
-    if voices:
-        print(f"\n🎤 Available voices ({len(voices)}):")
-        for voice in voices[:5]:  # Show first 5
-            langs = ', '.join(voice['languages']) if voice['languages'] else 'unknown'
-            desc = f" - {voice['description']}" if voice['description'] else ""
-            print(f"   • {voice['name']} ({langs}){desc}")
-        
-        if len(voices) > 5:
-            print(f"   ... and {len(voices) - 5} more")
+    if args.voices:
+        output_files = [voice_output_file(args.output, name) for name in args.voices]
     else:
-        print("\n⚠️  No voices reported by server")
+        output_files = [args.output]
     
-    print()
+    # Test server connection and get info
+    print("🔍 Checking server information...")
+    client = await connect_client(args.host, args.port)
     
-    # Synthesize test audio
-    success = await synthesize_test_text(
-        args.host, 
-        args.port, 
-        args.text, 
-        args.output,
-        target_voice
-    )
+    try:
+        success = await _run_client_tests(client, args, target_voice, env_config)
+    finally:
+        if client is not None:
+            await client.disconnect()
     
     if success:
         print(f"\n✅ Test completed successfully!")
         
         if args.play:
-            print()
-            play_audio(args.output)
+            for output_file in output_files:
+                print()
+                await play_audio(output_file)
         else:
             print(f"\n💡 To hear the voice, run: python3 test_voice.py --play")
-            print(f"   Or manually play: {args.output}")
+            print(f"   Or manually play: {', '.join(output_files)}")
     else:
         print(f"\n❌ Test failed")
         sys.exit(1)
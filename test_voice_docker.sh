@@ -78,6 +78,9 @@ from wyoming.audio import AudioChunk, AudioStop
 from wyoming.client import AsyncTcpClient
 from wyoming.tts import Synthesize
 
+# Seconds of audio to reserve up front; the buffer doubles if exceeded
+INITIAL_AUDIO_SECONDS = 10
+
 async def test_tts(text, output_file):
     try:
         async with AsyncTcpClient("wyoming-piper", 10200) as client:
@@ -86,7 +89,8 @@ async def test_tts(text, output_file):
             synthesize = Synthesize(text=text)
             await client.write_event(synthesize.event())
             
-            audio_data = bytearray()
+            audio_data = None
+            audio_size = 0
             audio_params = None
             
             while True:
@@ -106,18 +110,25 @@ async def test_tts(text, output_file):
                             'width': chunk.width,
                             'channels': chunk.channels
                         }
+                        bytes_per_second = chunk.rate * chunk.width * chunk.channels
+                        audio_data = bytearray(bytes_per_second * INITIAL_AUDIO_SECONDS)
+                    
+                    end = audio_size + len(chunk.audio)
+                    if end > len(audio_data):
+                        audio_data.extend(bytes(max(len(audio_data), end - len(audio_data))))
                     
-                    audio_data.extend(chunk.audio)
+                    audio_data[audio_size:end] = chunk.audio
+                    audio_size = end
             
-            if audio_params and audio_data:
+            if audio_params and audio_size:
                 with wave.open(output_file, 'wb') as wav_file:
                     wav_file.setframerate(audio_params['rate'])
                     wav_file.setsampwidth(audio_params['width'])
                     wav_file.setnchannels(audio_params['channels'])
-                    wav_file.writeframes(bytes(audio_data))
+                    wav_file.writeframes(memoryview(audio_data)[:audio_size])
                 
                 print(f"✓ Audio saved to: {output_file}")
-                print(f"📏 Size: {len(audio_data):,} bytes")
+                print(f"📏 Size: {audio_size:,} bytes")
                 return True
             
     except Exception as e: